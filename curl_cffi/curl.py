@@ -1,6 +1,7 @@
 import re
 import warnings
 from http.cookies import SimpleCookie
+from io import BytesIO
 from pathlib import Path
 from typing import Any, List, Literal, Optional, Tuple, Union, cast
 
@@ -33,6 +34,29 @@ CURLINFO_SSL_DATA_OUT = 6
 CURL_WRITEFUNC_PAUSE = 0x10000001
 CURL_WRITEFUNC_ERROR = 0xFFFFFFFF
 
+_SETOPT_INPUT_TYPES = {
+    # this should be int in curl, but cffi requires pointer for void*
+    # it will be convert back in the glue c code.
+    0: "long*",
+    10000: "char*",
+    20000: "void*",
+    30000: "int64_t*",  # offset type
+    40000: "void*",  # blob type
+}
+
+_GETINFO_RET_TYPES = {
+    0x100000: "char**",
+    0x200000: "long*",
+    0x300000: "double*",
+    0x400000: "struct curl_slist **",
+}
+
+_GETINFO_RET_CASTS = {
+    0x100000: ffi.string,
+    0x200000: int,
+    0x300000: float,
+}
+
 
 @ffi.def_extern()
 def debug_function(curl, type: int, data, size, clientp) -> int:
@@ -52,7 +76,11 @@ def buffer_callback(ptr, size, nmemb, userdata):
     """ffi callback for curl write function, directly writes to a buffer"""
     # assert size == 1
     buffer = ffi.from_handle(userdata)
-    buffer.write(ffi.buffer(ptr, nmemb)[:])
+    if type(buffer) is BytesIO:
+        # BytesIO copies from the buffer protocol itself, no need for a temporary bytes.
+        buffer.write(ffi.buffer(ptr, nmemb))
+    else:
+        buffer.write(ffi.buffer(ptr, nmemb)[:])
     return nmemb * size
 
 
@@ -156,19 +184,10 @@ class Curl:
         Returns:
             0 if no error, see ``CurlECode``.
         """
-        input_option = {
-            # this should be int in curl, but cffi requires pointer for void*
-            # it will be convert back in the glue c code.
-            0: "long*",
-            10000: "char*",
-            20000: "void*",
-            30000: "int64_t*",  # offset type
-            40000: "void*",  # blob type
-        }
         # print("option", option, "value", value)
 
         # Convert value
-        value_type = input_option.get((option // 10000) * 10000)
+        value_type = _SETOPT_INPUT_TYPES.get((option // 10000) * 10000)
         if value_type == "long*" or value_type == "int64_t*":
             c_value = ffi.new(value_type, value)
         elif option == CurlOpt.WRITEDATA:
@@ -187,7 +206,7 @@ class Curl:
         elif option == CurlOpt.HEADERFUNCTION:
             c_value = ffi.new_handle(value)
             self._header_handle = c_value
-            lib._curl_easy_setopt(self._curl, CurlOpt.WRITEFUNCTION, lib.write_callback)
+            lib._curl_easy_setopt(self._curl, CurlOpt.HEADERFUNCTION, lib.write_callback)
             option = CurlOpt.HEADERDATA
         elif value_type == "char*":
             c_value = value.encode() if isinstance(value, str) else value
@@ -229,18 +248,7 @@ class Curl:
         Returns:
             value retrieved from last perform.
         """
-        ret_option = {
-            0x100000: "char**",
-            0x200000: "long*",
-            0x300000: "double*",
-            0x400000: "struct curl_slist **",
-        }
-        ret_cast_option = {
-            0x100000: ffi.string,
-            0x200000: int,
-            0x300000: float,
-        }
-        c_value = ffi.new(ret_option[option & 0xF00000])
+        c_value = ffi.new(_GETINFO_RET_TYPES[option & 0xF00000])
         ret = lib.curl_easy_getinfo(self._curl, option, c_value)
         self._check_error(ret, "getinfo", option)
         # cookielist and ssl_engines starts with 0x400000, see also: const.py
@@ -248,23 +256,25 @@ class Curl:
             return slist_to_list(c_value[0])
         if c_value[0] == ffi.NULL:
             return b""
-        return ret_cast_option[option & 0xF00000](c_value[0])
+        return _GETINFO_RET_CASTS[option & 0xF00000](c_value[0])
 
     def version(self) -> bytes:
         """Get the underlying libcurl version."""
         return ffi.string(lib.curl_version())
 
-    def impersonate(self, target: str, default_headers: bool = True) -> int:
+    def impersonate(self, target: Union[str, bytes], default_headers: bool = True) -> int:
         """Set the browser type to impersonate.
 
         Parameters:
-            target: browser to impersonate.
+            target: browser to impersonate, bytes are passed to curl as is.
             default_headers: whether to add default headers, like User-Agent.
 
         Returns:
             0 if no error.
         """
-        return lib.curl_easy_impersonate(self._curl, target.encode(), int(default_headers))
+        if isinstance(target, str):
+            target = target.encode()
+        return lib.curl_easy_impersonate(self._curl, target, int(default_headers))
 
     def _ensure_cacert(self) -> None:
         if not self._is_cert_set:
@@ -85,6 +85,7 @@ def request(
         params: query string for the requests.
         data: form values(dict/list/tuple) or binary data to use in body,
             ``Content-Type: application/x-www-form-urlencoded`` will be added if a dict is given.
+            The whole content of a ``BytesIO`` is sent, regardless of its position.
         json: json values to use in body, `Content-Type: application/json` will be added
             automatically.
         headers: headers to send.
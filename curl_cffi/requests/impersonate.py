@@ -42,19 +42,17 @@ DEFAULT_SAFARI_IOS = "safari17_2_ios"
 DEFAULT_CHROME_ANDROID = "chrome99_android"
 
 
+BROWSER_ALIAS_MAP = {
+    "chrome": DEFAULT_CHROME,
+    "edge": DEFAULT_EDGE,
+    "safari": DEFAULT_SAFARI,
+    "safari_ios": DEFAULT_SAFARI_IOS,
+    "chrome_android": DEFAULT_CHROME_ANDROID,
+}
+
+
 def normalize_browser_type(item):
-    if item == "chrome":  # noqa: SIM116
-        return DEFAULT_CHROME
-    elif item == "edge":
-        return DEFAULT_EDGE
-    elif item == "safari":
-        return DEFAULT_SAFARI
-    elif item == "safari_ios":
-        return DEFAULT_SAFARI_IOS
-    elif item == "chrome_android":
-        return DEFAULT_CHROME_ANDROID
-    else:
-        return item
+    return BROWSER_ALIAS_MAP.get(item, item)
 
 
 class BrowserType(str, Enum):  # todo: remove in version 1.x
@@ -60,7 +60,12 @@ class Response:
         history: history redirections, only headers are available.
     """
 
-    def __init__(self, curl: Optional[Curl] = None, request: Optional[Request] = None):
+    def __init__(
+        self,
+        curl: Optional[Curl] = None,
+        request: Optional[Request] = None,
+        header_lines: Optional[List[bytes]] = None,
+    ):
         self.curl = curl
         self.request = request
         self.url = ""
@@ -68,7 +73,9 @@ class Response:
         self.status_code = 200
         self.reason = "OK"
         self.ok = True
-        self.headers = Headers()
+        self._headers: Optional[Headers] = None
+        # raw header lines, parsed lazily on first access to `headers`
+        self._header_lines: List[bytes] = header_lines or []
         self.cookies = Cookies()
         self.elapsed = 0.0
         self.default_encoding: Union[str, Callable[[bytes], str]] = "utf-8"
@@ -84,6 +91,17 @@ class Response:
         self.astream_task: Optional[Awaitable] = None
         self.quit_now = None
 
+    @property
+    def headers(self) -> Headers:
+        """Response headers, parsed from the raw header lines on first access."""
+        if self._headers is None:
+            self._headers = Headers(self._header_lines)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Headers) -> None:
+        self._headers = value
+
     @property
     def charset(self) -> str:
         """Alias for encoding."""
@@ -1,12 +1,13 @@
 import asyncio
 import math
 import queue
+import re
 import threading
 import warnings
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager, suppress
-from functools import partialmethod
+from functools import lru_cache, partialmethod
 from io import BytesIO
 from json import dumps
 from typing import (
@@ -21,8 +22,17 @@ from typing import (
     TypedDict,
     Union,
     cast,
+    get_args,
+)
+from urllib.parse import (
+    ParseResult,
+    quote,
+    quote_plus,
+    unquote_plus,
+    urlencode,
+    urljoin,
+    urlparse,
 )
-from urllib.parse import ParseResult, parse_qsl, quote, unquote, urlencode, urljoin, urlparse
 
 from typing_extensions import Unpack
 
@@ -31,11 +41,11 @@ from ..curl import CURL_WRITEFUNC_ERROR, CurlMime
 from .cookies import Cookies, CookieTypes, CurlMorsel
 from .exceptions import ImpersonateError, RequestException, SessionClosed, code2error
 from .headers import Headers, HeaderTypes
-from .impersonate import BrowserType  # noqa: F401
 from .impersonate import (
     TLS_CIPHER_NAME_MAP,
     TLS_EC_CURVES_MAP,
     TLS_VERSION_MAP,
+    BrowserType,
     BrowserTypeLiteral,
     ExtraFingerprints,
     ExtraFpDict,
@@ -94,6 +104,67 @@ else:
 ThreadType = Literal["eventlet", "gevent"]
 HttpMethod = Literal["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "TRACE", "PATCH"]
 
+# Reserved and unreserved chars from RFC 3986, plus "%" so that existing escapes survive.
+_URL_PATH_SAFE_CHARS = "!$%&'()*+,/:;=@~"
+_URL_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://")
+# A "%" that does not start a valid escape, it has to be quoted as "%25".
+_STRAY_PERCENT_RE = re.compile(r"%(?![0-9A-Fa-f]{2})")
+# Value of query keys without "=", e.g. "b" in "?a=1&b", so that they are sent back as is.
+_NO_VALUE: Any = object()
+
+# Pre-encoded values for the common cases, to skip encoding them on each request.
+_METHOD_BYTES = {m: m.encode() for m in get_args(HttpMethod)}
+_ACCEPT_ENCODING_BYTES = {e: e.encode() for e in ("gzip, deflate, br", "gzip, deflate, br, zstd")}
+_IMPERSONATE_TARGET_BYTES = {bt.value: bt.value.encode() for bt in BrowserType}
+
+# Enum member lookups are relatively slow, so every option set in `_set_curl_options` and
+# every info read in `_parse_response` is aliased here. The one-off fingerprint and
+# websocket setup code keeps using `CurlOpt.X` directly.
+_OPT_POST = CurlOpt.POST
+_OPT_CUSTOMREQUEST = CurlOpt.CUSTOMREQUEST
+_OPT_URL = CurlOpt.URL
+_OPT_POSTFIELDS = CurlOpt.POSTFIELDS
+_OPT_POSTFIELDSIZE = CurlOpt.POSTFIELDSIZE
+_OPT_HTTPHEADER = CurlOpt.HTTPHEADER
+_OPT_COOKIEFILE = CurlOpt.COOKIEFILE
+_OPT_COOKIELIST = CurlOpt.COOKIELIST
+_OPT_TIMEOUT_MS = CurlOpt.TIMEOUT_MS
+_OPT_FOLLOWLOCATION = CurlOpt.FOLLOWLOCATION
+_OPT_MAXREDIRS = CurlOpt.MAXREDIRS
+_OPT_ACCEPT_ENCODING = CurlOpt.ACCEPT_ENCODING
+_OPT_WRITEDATA = CurlOpt.WRITEDATA
+_OPT_WRITEFUNCTION = CurlOpt.WRITEFUNCTION
+_OPT_HEADERFUNCTION = CurlOpt.HEADERFUNCTION
+_OPT_MAX_RECV_SPEED_LARGE = CurlOpt.MAX_RECV_SPEED_LARGE
+_OPT_NOBODY = CurlOpt.NOBODY
+_OPT_MIMEPOST = CurlOpt.MIMEPOST
+_OPT_USERNAME = CurlOpt.USERNAME
+_OPT_PASSWORD = CurlOpt.PASSWORD
+_OPT_CONNECTTIMEOUT_MS = CurlOpt.CONNECTTIMEOUT_MS
+_OPT_LOW_SPEED_LIMIT = CurlOpt.LOW_SPEED_LIMIT
+_OPT_LOW_SPEED_TIME = CurlOpt.LOW_SPEED_TIME
+_OPT_PROXY = CurlOpt.PROXY
+_OPT_HTTPPROXYTUNNEL = CurlOpt.HTTPPROXYTUNNEL
+_OPT_PROXYUSERNAME = CurlOpt.PROXYUSERNAME
+_OPT_PROXYPASSWORD = CurlOpt.PROXYPASSWORD
+_OPT_SSL_VERIFYPEER = CurlOpt.SSL_VERIFYPEER
+_OPT_SSL_VERIFYHOST = CurlOpt.SSL_VERIFYHOST
+_OPT_CAINFO = CurlOpt.CAINFO
+_OPT_REFERER = CurlOpt.REFERER
+_OPT_SSLCERT = CurlOpt.SSLCERT
+_OPT_SSLKEY = CurlOpt.SSLKEY
+_OPT_HTTP_VERSION = CurlOpt.HTTP_VERSION
+_OPT_INTERFACE = CurlOpt.INTERFACE
+_INFO_EFFECTIVE_URL = CurlInfo.EFFECTIVE_URL
+_INFO_HTTP_VERSION = CurlInfo.HTTP_VERSION
+_INFO_RESPONSE_CODE = CurlInfo.RESPONSE_CODE
+_INFO_COOKIELIST = CurlInfo.COOKIELIST
+_INFO_PRIMARY_IP = CurlInfo.PRIMARY_IP
+_INFO_LOCAL_IP = CurlInfo.LOCAL_IP
+_INFO_TOTAL_TIME = CurlInfo.TOTAL_TIME
+_INFO_REDIRECT_COUNT = CurlInfo.REDIRECT_COUNT
+_INFO_REDIRECT_URL = CurlInfo.REDIRECT_URL
+
 
 def _is_absolute_url(url: str) -> bool:
     """Check if the provided url is an absolute url"""
@@ -101,6 +172,67 @@ def _is_absolute_url(url: str) -> bool:
     return bool(parsed_url.scheme and parsed_url.hostname)
 
 
+def _quote_url_path(base: str) -> str:
+    """Quote the path part of a url without the query, keeping valid escapes intact."""
+    scheme = _URL_SCHEME_RE.match(base)
+    path_start = base.find("/", scheme.end()) if scheme else 0
+    if path_start == -1:
+        return base
+    path = _STRAY_PERCENT_RE.sub("%25", base[path_start:])
+    return base[:path_start] + quote(path, safe=_URL_PATH_SAFE_CHARS)
+
+
+def _parse_query(query: str) -> List[Tuple[str, Any]]:
+    """Split a query string into (key, value) pairs, like ``parse_qsl``, but keep blanks.
+
+    Keys without "=" get ``_NO_VALUE`` as value.
+    """
+    args = []
+    for pair in query.split("&"):
+        if not pair:
+            continue
+        key, sep, value = pair.partition("=")
+        args.append((unquote_plus(key), unquote_plus(value) if sep else _NO_VALUE))
+    return args
+
+
+@lru_cache(maxsize=1024)
+def _split_url(url: str) -> Tuple[str, Tuple[Tuple[str, Any], ...], str]:
+    """Split url into quoted base, parsed query args and fragment.
+
+    Sessions usually hit a small set of urls, so the result is cached.
+    """
+    # Fragment always comes after the query, so split it off first. Valid escapes in the
+    # path are kept as is, while the query is decoded here and re-encoded by urlencode.
+    url, _, fragment = url.partition("#")
+    base, _, query = url.partition("?")
+    return _quote_url_path(base), tuple(_parse_query(query)), fragment
+
+
+def _encode_query(args: Union[List, Tuple]) -> str:
+    if not any(v is _NO_VALUE for _, v in args):
+        return urlencode(args, doseq=True)
+    parts = (
+        quote_plus(k) if v is _NO_VALUE else urlencode([(k, v)], doseq=True) for k, v in args
+    )
+    return "&".join(p for p in parts if p)
+
+
+def _join_url(base: str, args: Union[List, Tuple], fragment: str) -> str:
+    query = _encode_query(args)
+    if query:
+        base = f"{base}?{query}"
+    if fragment:
+        base = f"{base}#{fragment}"
+    return base
+
+
+@lru_cache(maxsize=1024)
+def _normalize_url(url: str) -> str:
+    """Quote the url as ``_update_url_params`` does, without adding any params."""
+    return _join_url(*_split_url(url))
+
+
 def _update_url_params(url: str, *params_list: Union[Dict, List, Tuple, None]) -> str:
     """Add URL query params to provided URL being aware of existing.
 
@@ -116,23 +248,26 @@ def _update_url_params(url: str, *params_list: Union[Dict, List, Tuple, None]) -
     >> _update_url_params(url, new_params)
     'http://stackoverflow.com/test?data=some&data=values&answers=false'
     """
-    # Unquoting and parse
-    url = unquote(url)
-    parsed_url = urlparse(url)
+    # Nothing to merge, the url only needs to be normalized, which is cached.
+    if not any(params_list):
+        return _normalize_url(url)
+
+    base, parsed_args, fragment = _split_url(url)
 
-    # Extracting URL arguments from parsed URL, NOTE the result is a list, not dict
-    parsed_get_args = parse_qsl(parsed_url.query)
+    # NOTE the result is a list, not dict, since a key may appear multiple times
+    args = list(parsed_args)
 
-    # Merging URL arguments dict with new params
+    # Merging URL arguments with new params
     for params in params_list:
         if not params:
             continue
 
         # Check the args appearance count of keys
-        old_args_counter = Counter(x[0] for x in parsed_get_args)
+        old_args_counter = Counter(k for k, _ in args)
         if isinstance(params, dict):
             params = list(params.items())
-        new_args_counter = Counter(x[0] for x in params)
+        new_args_counter = Counter(k for k, _ in params)
+        positions = {k: idx for idx, (k, _) in enumerate(args)}
 
         for key, value in params:
             # Bool and dict values should be converted to json-friendly values
@@ -141,36 +276,28 @@ def _update_url_params(url: str, *params_list: Union[Dict, List, Tuple, None]) -
 
             # k:v is 1-to-1 mapping, we have to search and update it, e.g. k=v
             if old_args_counter.get(key) == 1 and new_args_counter.get(key) == 1:
-                parsed_get_args = [(x if x[0] != key else (key, value)) for x in parsed_get_args]
+                args[positions[key]] = (key, value)
             # k:v is 1-to-list mapping, simply append them, e.g. k=v1&k=v2
             else:
-                parsed_get_args.append((key, value))
+                args.append((key, value))
 
-    # Converting URL argument to proper query string
-    encoded_get_args = urlencode(parsed_get_args, doseq=True)
+    return _join_url(base, args, fragment)
 
-    # Creating new parsed result object based on provided with new
-    # URL arguments. Same thing happens inside of urlparse.
-    new_url = ParseResult(
-        parsed_url.scheme,
-        parsed_url.netloc,
-        quote(parsed_url.path),
-        parsed_url.params,
-        encoded_get_args,
-        parsed_url.fragment,
-    ).geturl()
 
-    return new_url
+def _update_header_line(
+    header_lines: List[bytes], header_index: Dict[str, int], key: str, value: str
+):
+    """Update header line list by key value pair.
 
-
-def _update_header_line(header_lines: List[str], key: str, value: str):
-    """Update header line list by key value pair."""
-    for idx, line in enumerate(header_lines):
-        if line.lower().startswith(key.lower() + ":"):
-            header_lines[idx] = f"{key}: {value}"
-            break
-    else:  # if not break
-        header_lines.append(f"{key}: {value}")
+    ``header_index`` maps lower-cased header keys to the position of their first line.
+    """
+    line = f"{key}: {value}".encode()
+    idx = header_index.get(key.lower())
+    if idx is None:
+        header_index[key.lower()] = len(header_lines)
+        header_lines.append(line)
+    else:
+        header_lines[idx] = line
 
 
 def _peek_queue(q: queue.Queue, default=None):
@@ -389,29 +516,31 @@ class BaseSession:
 
         # method
         if method == "POST":
-            c.setopt(CurlOpt.POST, 1)
+            c.setopt(_OPT_POST, 1)
         elif method != "GET":
-            c.setopt(CurlOpt.CUSTOMREQUEST, method.encode())
+            c.setopt(_OPT_CUSTOMREQUEST, _METHOD_BYTES.get(method) or method.encode())
         if method == "HEAD":
-            c.setopt(CurlOpt.NOBODY, 1)
+            c.setopt(_OPT_NOBODY, 1)
 
-        # url, always unquote and re-quote
+        # url, keep existing escapes and quote the unsafe chars
         url = _update_url_params(url, self.params, params)
         if self.base_url:
             url = urljoin(self.base_url, url)
-        c.setopt(CurlOpt.URL, url.encode())
+        c.setopt(_OPT_URL, url.encode())
 
         # data/body/json
-        if isinstance(data, (dict, list, tuple)):
-            body = urlencode(data).encode()
+        # most requests carry no data at all, check that first
+        if data is None:
+            body = b""
+        elif isinstance(data, bytes):
+            body = data
         elif isinstance(data, str):
             body = data.encode()
+        elif isinstance(data, (dict, list, tuple)):
+            body = urlencode(data).encode()
         elif isinstance(data, BytesIO):
-            body = data.read()
-        elif isinstance(data, bytes):
-            body = data
-        elif data is None:
-            body = b""
+            # the whole buffer is sent, and the stream position is left untouched for retries
+            body = data.getvalue()
         else:
             raise TypeError("data must be dict/list/tuple, str, BytesIO or bytes")
         if json is not None:
@@ -422,11 +551,11 @@ class BaseSession:
         # 2. GET/DELETE with body, although it's against the RFC, some applications.
         #   e.g. Elasticsearch, use this.
         if body or method in ("POST", "PUT", "PATCH"):
-            c.setopt(CurlOpt.POSTFIELDS, body)
+            c.setopt(_OPT_POSTFIELDS, body)
             # necessary if body contains '\0'
-            c.setopt(CurlOpt.POSTFIELDSIZE, len(body))
+            c.setopt(_OPT_POSTFIELDSIZE, len(body))
             if method == "GET":
-                c.setopt(CurlOpt.CUSTOMREQUEST, method)
+                c.setopt(_OPT_CUSTOMREQUEST, _METHOD_BYTES["GET"])
 
         # headers
         h = Headers(self.headers)
@@ -435,42 +564,50 @@ class BaseSession:
         # remove Host header if it's unnecessary, otherwise curl may get confused.
         # Host header will be automatically added by curl if it's not present.
         # https://github.com/lexiforest/curl_cffi/issues/119
+        # the parsed url is shared with the proxy selection below
+        parts: Optional[ParseResult] = None
         host_header = h.get("Host")
         if host_header is not None:
-            u = urlparse(url)
-            if host_header == u.netloc or host_header == u.hostname:
+            parts = urlparse(url)
+            if host_header == parts.netloc or host_header == parts.hostname:
                 h.pop("Host", None)
 
         # Make curl always include empty headers.
         # See: https://stackoverflow.com/a/32911474/1061155
-        header_lines = []
+        header_lines: List[bytes] = []
+        header_index: Dict[str, int] = {}
         for k, v in h.multi_items():
-            header_lines.append(f"{k}: {v}" if v else f"{k};")
+            header_index.setdefault(k.lower(), len(header_lines))
+            header_lines.append(f"{k}: {v}".encode() if v else f"{k};".encode())
 
         # Add content-type if missing
         if json is not None:
-            _update_header_line(header_lines, "Content-Type", "application/json")
+            _update_header_line(header_lines, header_index, "Content-Type", "application/json")
         if isinstance(data, dict) and method != "POST":
-            _update_header_line(header_lines, "Content-Type", "application/x-www-form-urlencoded")
+            _update_header_line(
+                header_lines, header_index, "Content-Type", "application/x-www-form-urlencoded"
+            )
 
         # Never send `Expect` header.
-        _update_header_line(header_lines, "Expect", "")
+        _update_header_line(header_lines, header_index, "Expect", "")
 
-        c.setopt(CurlOpt.HTTPHEADER, [h.encode() for h in header_lines])
+        c.setopt(_OPT_HTTPHEADER, header_lines)
 
         req = Request(url, h, method)
 
         # cookies
-        c.setopt(CurlOpt.COOKIEFILE, b"")  # always enable the curl cookie engine first
-        c.setopt(CurlOpt.COOKIELIST, "ALL")  # remove all the old cookies first.
-
-        for morsel in self.cookies.get_cookies_for_curl(req):
-            # print("Setting", morsel.to_curl_format())
-            curl.setopt(CurlOpt.COOKIELIST, morsel.to_curl_format())
+        c.setopt(_OPT_COOKIEFILE, b"")  # always enable the curl cookie engine first
+        c.setopt(_OPT_COOKIELIST, "ALL")  # remove all the old cookies first.
+
+        # skip the locking and expiry pass over the jar when it has nothing to offer
+        if self.cookies:
+            for morsel in self.cookies.get_cookies_for_curl(req):
+                # print("Setting", morsel.to_curl_format())
+                curl.setopt(_OPT_COOKIELIST, morsel.to_curl_format())
         if cookies:
             temp_cookies = Cookies(cookies)
             for morsel in temp_cookies.get_cookies_for_curl(req):
-                curl.setopt(CurlOpt.COOKIELIST, morsel.to_curl_format())
+                curl.setopt(_OPT_COOKIELIST, morsel.to_curl_format())
 
         # files
         if files:
@@ -484,7 +621,7 @@ class BaseSession:
             # multipart will overrides postfields
             for k, v in cast(dict, data or {}).items():
                 multipart.addpart(name=k, data=v.encode() if isinstance(v, str) else v)
-            c.setopt(CurlOpt.MIMEPOST, multipart._form)
+            c.setopt(_OPT_MIMEPOST, multipart._form)
 
         # auth
         if self.auth or auth:
@@ -492,8 +629,8 @@ class BaseSession:
                 username, password = self.auth
             if auth:
                 username, password = auth
-            c.setopt(CurlOpt.USERNAME, username.encode())  # pyright: ignore [reportPossiblyUnboundVariable=none]
-            c.setopt(CurlOpt.PASSWORD, password.encode())  # pyright: ignore [reportPossiblyUnboundVariable=none]
+            c.setopt(_OPT_USERNAME, username.encode())  # pyright: ignore [reportPossiblyUnboundVariable=none]
+            c.setopt(_OPT_PASSWORD, password.encode())  # pyright: ignore [reportPossiblyUnboundVariable=none]
 
         # timeout
         if timeout is not_set:
@@ -504,31 +641,31 @@ class BaseSession:
         if isinstance(timeout, tuple):
             connect_timeout, read_timeout = timeout
             all_timeout = connect_timeout + read_timeout
-            c.setopt(CurlOpt.CONNECTTIMEOUT_MS, int(connect_timeout * 1000))
+            c.setopt(_OPT_CONNECTTIMEOUT_MS, int(connect_timeout * 1000))
             if not stream:
-                c.setopt(CurlOpt.TIMEOUT_MS, int(all_timeout * 1000))
+                c.setopt(_OPT_TIMEOUT_MS, int(all_timeout * 1000))
             else:
                 # trick from: https://github.com/lexiforest/curl_cffi/issues/156
-                c.setopt(CurlOpt.LOW_SPEED_LIMIT, 1)
-                c.setopt(CurlOpt.LOW_SPEED_TIME, math.ceil(all_timeout))
+                c.setopt(_OPT_LOW_SPEED_LIMIT, 1)
+                c.setopt(_OPT_LOW_SPEED_TIME, math.ceil(all_timeout))
 
         elif isinstance(timeout, (int, float)):
             if not stream:
-                c.setopt(CurlOpt.TIMEOUT_MS, int(timeout * 1000))
+                c.setopt(_OPT_TIMEOUT_MS, int(timeout * 1000))
             else:
-                c.setopt(CurlOpt.CONNECTTIMEOUT_MS, int(timeout * 1000))
-                c.setopt(CurlOpt.LOW_SPEED_LIMIT, 1)
-                c.setopt(CurlOpt.LOW_SPEED_TIME, math.ceil(timeout))
+                c.setopt(_OPT_CONNECTTIMEOUT_MS, int(timeout * 1000))
+                c.setopt(_OPT_LOW_SPEED_LIMIT, 1)
+                c.setopt(_OPT_LOW_SPEED_TIME, math.ceil(timeout))
 
         # allow_redirects
         c.setopt(
-            CurlOpt.FOLLOWLOCATION,
+            _OPT_FOLLOWLOCATION,
             int(self.allow_redirects if allow_redirects is None else allow_redirects),
         )
 
         # max_redirects
         c.setopt(
-            CurlOpt.MAXREDIRS,
+            _OPT_MAXREDIRS,
             self.max_redirects if max_redirects is None else max_redirects,
         )
 
@@ -541,7 +678,8 @@ class BaseSession:
             proxies = self.proxies
 
         if proxies:
-            parts = urlparse(url)
+            if parts is None:
+                parts = urlparse(url)
             proxy = cast(Optional[str], proxies.get(parts.scheme, proxies.get("all")))
             if parts.hostname:
                 proxy = (
@@ -556,7 +694,7 @@ class BaseSession:
                 )
 
             if proxy is not None:
-                c.setopt(CurlOpt.PROXY, proxy)
+                c.setopt(_OPT_PROXY, proxy)
 
                 if parts.scheme == "https":
                     if proxy.startswith("https://"):
@@ -569,52 +707,56 @@ class BaseSession:
                         )
                     # For https site with http tunnel proxy, tell curl to enable tunneling
                     if not proxy.startswith("socks"):
-                        c.setopt(CurlOpt.HTTPPROXYTUNNEL, 1)
+                        c.setopt(_OPT_HTTPPROXYTUNNEL, 1)
 
                 # proxy_auth
                 proxy_auth = proxy_auth or self.proxy_auth
                 if proxy_auth:
                     username, password = proxy_auth
-                    c.setopt(CurlOpt.PROXYUSERNAME, username.encode())
-                    c.setopt(CurlOpt.PROXYPASSWORD, password.encode())
+                    c.setopt(_OPT_PROXYUSERNAME, username.encode())
+                    c.setopt(_OPT_PROXYPASSWORD, password.encode())
 
         # verify
         if verify is False or not self.verify and verify is None:
-            c.setopt(CurlOpt.SSL_VERIFYPEER, 0)
-            c.setopt(CurlOpt.SSL_VERIFYHOST, 0)
+            c.setopt(_OPT_SSL_VERIFYPEER, 0)
+            c.setopt(_OPT_SSL_VERIFYHOST, 0)
 
         # cert for this single request
         if isinstance(verify, str):
-            c.setopt(CurlOpt.CAINFO, verify)
+            c.setopt(_OPT_CAINFO, verify)
 
         # cert for the session
         if verify in (None, True) and isinstance(self.verify, str):
-            c.setopt(CurlOpt.CAINFO, self.verify)
+            c.setopt(_OPT_CAINFO, self.verify)
 
         # referer
         if referer:
-            c.setopt(CurlOpt.REFERER, referer.encode())
+            c.setopt(_OPT_REFERER, referer.encode())
 
         # accept_encoding
         if accept_encoding is not None:
-            c.setopt(CurlOpt.ACCEPT_ENCODING, accept_encoding.encode())
+            c.setopt(
+                _OPT_ACCEPT_ENCODING,
+                _ACCEPT_ENCODING_BYTES.get(accept_encoding) or accept_encoding.encode(),
+            )
 
         # cert
         cert = cert or self.cert
         if cert:
             if isinstance(cert, str):
-                c.setopt(CurlOpt.SSLCERT, cert)
+                c.setopt(_OPT_SSLCERT, cert)
             else:
                 cert, key = cert
-                c.setopt(CurlOpt.SSLCERT, cert)
-                c.setopt(CurlOpt.SSLKEY, key)
+                c.setopt(_OPT_SSLCERT, cert)
+                c.setopt(_OPT_SSLKEY, key)
 
         # impersonate
         impersonate = impersonate or self.impersonate
         default_headers = self.default_headers if default_headers is None else default_headers
         if impersonate:
             impersonate = normalize_browser_type(impersonate)
-            ret = c.impersonate(impersonate, default_headers=default_headers)
+            target = _IMPERSONATE_TARGET_BYTES.get(impersonate) or impersonate
+            ret = c.impersonate(target, default_headers=default_headers)
             if ret != 0:
                 raise ImpersonateError(f"Impersonating {impersonate} is not supported")
 
@@ -652,7 +794,7 @@ class BaseSession:
         # http_version, after impersonate, which will change this to http2
         http_version = http_version or self.http_version
         if http_version:
-            c.setopt(CurlOpt.HTTP_VERSION, http_version)
+            c.setopt(_OPT_HTTP_VERSION, http_version)
 
         # set extra curl options, must come after impersonate, because it will alter some options
         for k, v in self.curl_options.items():
@@ -675,66 +817,78 @@ class BaseSession:
                 q.put_nowait(chunk)
                 return len(chunk)
 
-            c.setopt(CurlOpt.WRITEFUNCTION, qput)
+            c.setopt(_OPT_WRITEFUNCTION, qput)
         elif content_callback is not None:
-            c.setopt(CurlOpt.WRITEFUNCTION, content_callback)
+            c.setopt(_OPT_WRITEFUNCTION, content_callback)
         else:
             buffer = BytesIO()
-            c.setopt(CurlOpt.WRITEDATA, buffer)
-        header_buffer = BytesIO()
-        c.setopt(CurlOpt.HEADERDATA, header_buffer)
+            c.setopt(_OPT_WRITEDATA, buffer)
+
+        # curl calls the header function once per line, keep only the lines of the
+        # last response, since earlier ones belong to redirects.
+        header_buffer: List[bytes] = []
+
+        def on_header(line: bytes):
+            if line.startswith(b"HTTP/"):
+                header_buffer.clear()
+            # drop the line ending, and the empty line that ends the header block
+            stripped = line.rstrip(b"\r\n")
+            if stripped:
+                header_buffer.append(stripped)
+            return len(line)
+
+        c.setopt(_OPT_HEADERFUNCTION, on_header)
 
         # interface
         interface = interface or self.interface
         if interface:
-            c.setopt(CurlOpt.INTERFACE, interface.encode())
+            c.setopt(_OPT_INTERFACE, interface.encode())
 
         # max_recv_speed
         # do not check, since 0 is a valid value to disable it
-        c.setopt(CurlOpt.MAX_RECV_SPEED_LARGE, max_recv_speed)
+        c.setopt(_OPT_MAX_RECV_SPEED_LARGE, max_recv_speed)
 
         return req, buffer, header_buffer, q, header_recved, quit_now
 
     def _parse_response(self, curl, buffer, header_buffer, default_encoding):
         c = curl
-        rsp = Response(c)
-        rsp.url = cast(bytes, c.getinfo(CurlInfo.EFFECTIVE_URL)).decode()
-        if buffer:
-            rsp.content = buffer.getvalue()
-        rsp.http_version = cast(int, c.getinfo(CurlInfo.HTTP_VERSION))
-        rsp.status_code = cast(int, c.getinfo(CurlInfo.RESPONSE_CODE))
-        rsp.ok = 200 <= rsp.status_code < 400
-        header_lines = header_buffer.getvalue().splitlines()
 
         # TODO history urls
         header_list = []
+        header_lines = iter(header_buffer)
+        reason = None
+        # header_buffer only holds the last response, which starts with its status line
+        if header_buffer and header_buffer[0].startswith(b"HTTP/"):
+            reason = c.get_reason_phrase(next(header_lines)).decode()
         for header_line in header_lines:
-            if not header_line.strip():
-                continue
-            if header_line.startswith(b"HTTP/"):
-                # read header from last response
-                rsp.reason = c.get_reason_phrase(header_line).decode()
-                # empty header list for new redirected response
-                header_list = []
-                continue
-            if header_line.startswith(b" ") or header_line.startswith(b"\t"):
+            if header_line[:1] in (b" ", b"\t"):
                 header_list[-1] += header_line
                 continue
             header_list.append(header_line)
-        rsp.headers = Headers(header_list)
+
+        # headers are parsed lazily, since many callers never look at them
+        rsp = Response(c, header_lines=header_list)
+        if reason is not None:
+            rsp.reason = reason
+        rsp.url = cast(bytes, c.getinfo(_INFO_EFFECTIVE_URL)).decode()
+        if buffer:
+            rsp.content = buffer.getvalue()
+        rsp.http_version = cast(int, c.getinfo(_INFO_HTTP_VERSION))
+        rsp.status_code = cast(int, c.getinfo(_INFO_RESPONSE_CODE))
+        rsp.ok = 200 <= rsp.status_code < 400
         # print("Set-cookie", rsp.headers["set-cookie"])
-        morsels = [CurlMorsel.from_curl_format(c) for c in c.getinfo(CurlInfo.COOKIELIST)]
+        morsels = [CurlMorsel.from_curl_format(c) for c in c.getinfo(_INFO_COOKIELIST)]
         # for l in c.getinfo(CurlInfo.COOKIELIST):
         #     print("Curl Cookies", l.decode())
         self.cookies.update_cookies_from_curl(morsels)
         rsp.cookies = self.cookies
         # print("Cookies after extraction", self.cookies)
-        rsp.primary_ip = cast(bytes, c.getinfo(CurlInfo.PRIMARY_IP)).decode()
-        rsp.local_ip = cast(bytes, c.getinfo(CurlInfo.LOCAL_IP)).decode()
+        rsp.primary_ip = cast(bytes, c.getinfo(_INFO_PRIMARY_IP)).decode()
+        rsp.local_ip = cast(bytes, c.getinfo(_INFO_LOCAL_IP)).decode()
         rsp.default_encoding = default_encoding
-        rsp.elapsed = cast(float, c.getinfo(CurlInfo.TOTAL_TIME))
-        rsp.redirect_count = cast(int, c.getinfo(CurlInfo.REDIRECT_COUNT))
-        rsp.redirect_url = cast(bytes, c.getinfo(CurlInfo.REDIRECT_URL)).decode()
+        rsp.elapsed = cast(float, c.getinfo(_INFO_TOTAL_TIME))
+        rsp.redirect_count = cast(int, c.getinfo(_INFO_REDIRECT_COUNT))
+        rsp.redirect_url = cast(bytes, c.getinfo(_INFO_REDIRECT_URL)).decode()
 
         for info in self.curl_infos:
             rsp.infos[info] = c.getinfo(info)
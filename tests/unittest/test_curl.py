@@ -291,6 +291,26 @@ def test_response_headers(server):
             assert line.startswith("x-test: test")
 
 
+def test_header_function(server):
+    c = Curl()
+    url = str(server.url.copy_with(path="/set_headers"))
+    c.setopt(CurlOpt.URL, url.encode())
+    body = BytesIO()
+    c.setopt(CurlOpt.WRITEDATA, body)
+    header_lines = []
+
+    def on_header(line):
+        header_lines.append(line)
+        return len(line)
+
+    # must not replace the body writer set above
+    c.setopt(CurlOpt.HEADERFUNCTION, on_header)
+    c.perform()
+    assert body.getvalue() == b"Hello, world!"
+    assert header_lines[0].startswith(b"HTTP/")
+    assert b"x-test: test\r\n" in header_lines
+
+
 def test_response_cookies(server):
     c = Curl()
     url = str(server.url.copy_with(path="/set_cookies"))
@@ -53,6 +53,18 @@ def test_post_str(server):
     assert r.content == b'{"foo": "bar"}'
 
 
+def test_post_bytesio(server):
+    data = BytesIO(b"foo=bar")
+    data.seek(0, 2)
+    url = str(server.url.copy_with(path="/echo_body"))
+    # the whole buffer is sent regardless of position, which is left untouched
+    for _ in range(2):
+        r = requests.post(url, data=data)
+        assert r.status_code == 200
+        assert r.content == b"foo=bar"
+        assert data.tell() == 7
+
+
 def test_post_no_body(server):
     r = requests.post(str(server.url), headers={"Content-Type": "application/json"})
     assert r.status_code == 200
@@ -147,6 +159,37 @@ def test_update_url_params():
     updated_url = "https://example.com/post.json?limit=1&tags=bar&page=0"
     assert _update_url_params(url, session_params, request_params) == updated_url
 
+    # existing escapes and fragment should be kept
+    url = "https://example.com/a%2Fb c?q=x%26y#top"
+    params = {"page": 1}
+    updated_url = "https://example.com/a%2Fb%20c?q=x%26y&page=1#top"
+    assert _update_url_params(url, params) == updated_url
+
+    # stray "%" in the path should be quoted, valid escapes kept
+    url = "https://example.com/50%off/a%2Fb%4"
+    quoted = "https://example.com/50%25off/a%2Fb%254"
+    assert _update_url_params(url) == quoted
+
+    # "://" later in a relative path is not a scheme
+    url = "/web/a b/http://x.com/c d"
+    quoted = "/web/a%20b/http://x.com/c%20d"
+    assert _update_url_params(url) == quoted
+
+    # keys without value should be kept as is
+    url = "https://example.com/post.json?limit=1&debug"
+    assert _update_url_params(url) == url
+    params = {"page": 1}
+    updated_url = "https://example.com/post.json?limit=1&debug&page=1"
+    assert _update_url_params(url, params) == updated_url
+    params = {"debug": 1}
+    updated_url = "https://example.com/post.json?limit=1&debug=1"
+    assert _update_url_params(url, params) == updated_url
+
+    # query without merge is re-encoded, blank values kept
+    url = "https://example.com/post.json?tags=a,b&q=x%26y&empty="
+    quoted = "https://example.com/post.json?tags=a%2Cb&q=x%26y&empty="
+    assert _update_url_params(url) == quoted
+
 
 def test_params(server):
     r = requests.get(str(server.url.copy_with(path="/echo_params")), params={"foo": "bar"})
@@ -399,6 +442,21 @@ def test_session_base_url(server):
     assert r.url == str(server.url.copy_with(path="/x/y"))
 
 
+def test_session_headers_not_shared_with_request(server):
+    host = f"{server.url.host}:{server.url.port}"
+    s = requests.Session(headers={"Host": host, "X-Foo": "bar"})
+    r = s.get(str(server.url.copy_with(path="/echo_headers")))
+    assert r.status_code == 200
+    # the redundant Host header is dropped from the request, not from the session
+    assert s.headers["Host"] == host
+    assert s.headers["X-Foo"] == "bar"
+
+    r.request.headers["X-Foo"] = "baz"
+    r.request.headers["X-New"] = "new"
+    assert s.headers["X-Foo"] == "bar"
+    assert "X-New" not in s.headers
+
+
 def test_session_update_parms(server):
     s = requests.Session(params={"old": "day"})
     r = s.get(str(server.url.copy_with(path="/echo_params")), params={"foo": "bar"})